@@ -1,47 +1,141 @@
-from functools import partial
+import sys
 from itertools import chain
+from operator import itemgetter
 
-from django.utils.functional import cached_property
 from rest_framework import serializers
 from rest_framework.filters import BaseFilterBackend
 
 
+# Shared by all single field steps; `**` unpacking never modifies it.
+_NO_KWARGS = {}
+
+
+def _values_getter(fields):
+    """Like `itemgetter(*fields)`, but always returns a tuple."""
+    if not fields:
+        return lambda data: ()
+    getter = itemgetter(*fields)
+    if len(fields) == 1:
+        return lambda data: (getter(data),)
+    return getter
+
+
+def _named_filter(name):
+    """Return a `filter_<name>` method that calls `self.filter`.
+
+    The configuration of the named filter is passed on to `filter`, unless
+    overridden by the caller.
+    """
+    def filter_named(self, qs, **kwargs):
+        fields, filter_together = self._filter_configs.get(name, (None, None))
+        kwargs.setdefault('name', name)
+        kwargs.setdefault('fields', fields)
+        kwargs.setdefault('filter_together', filter_together)
+        return self.filter(qs, **kwargs)
+    filter_named.__name__ = f'filter_{name}'
+    return filter_named
+
+
 class SerializerBackend(BaseFilterBackend):
     def filter_queryset(self, request=None, queryset=None, view=None):
+        serializer_class = self._get_serializer_class(view)
+        if serializer_class._skip_empty and not request.GET:
+            return queryset
+
+        serializer = serializer_class(data=request.GET)
+        return serializer.filter(queryset)
+
+    @classmethod
+    def _get_serializer_class(cls, view):
         serializer_class = getattr(view, 'serializer_filter_class', None)
         if not serializer_class:
             serializer_class = view.serializer_class
 
-        if not issubclass(serializer_class, FilterMixin):
-            namespaces = {}
-            if getattr(serializer_class, 'Meta', None):
-                namespaces['Meta'] = serializer_class.Meta
-            serializer_class = type(
-                'DefaultSerializerFilter', (FilterMixin, serializer_class),
-                namespaces)
+        if not getattr(serializer_class, '_is_filter_mixin', False):
+            serializer_class = cls._get_filter_subclass(serializer_class)
+        return serializer_class
 
-        serializer = serializer_class(data=request.GET)
-        return serializer.filter(queryset)
+    @classmethod
+    def _get_filter_subclass(cls, serializer_class):
+        # The generated subclass is stored on the serializer class itself, so
+        # it lives exactly as long as the serializer class does. Look it up
+        # from `__dict__` so that subclasses get their own.
+        subclass = serializer_class.__dict__.get('_serfilter_subclass')
+        if subclass is not None:
+            return subclass
+
+        namespaces = {}
+        if getattr(serializer_class, 'Meta', None):
+            namespaces['Meta'] = serializer_class.Meta
+        subclass = type(
+            'DefaultSerializerFilter', (FilterMixin, serializer_class),
+            namespaces)
+        serializer_class._serfilter_subclass = subclass
+        return subclass
 
 
 class FilterMixin(object):
     class Meta:
         filter_by = None
         filter_named = None
+        # Skip validation and filtering when there are no query parameters.
+        # Only safe if no field is required or has a default.
+        skip_empty = False
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        if self._filter_by:
-            self._configure_filter_by(None, self._filter_by)
+    _is_filter_mixin = True
+    _filter_by = None
+    _filter_named = None
+    _skip_empty = False
+    _filter_configs = {None: (None, None)}
+    _prepared_filters = {}
+    _filter_dispatch = {}
 
-        filter_named = self._filter_named
-        if filter_named:
-            assert isinstance(filter_named, dict), (
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, 'Meta', None)
+        cls._filter_by = getattr(meta, 'filter_by', None)
+        cls._filter_named = getattr(meta, 'filter_named', None)
+        cls._skip_empty = getattr(meta, 'skip_empty', False)
+
+        if cls._filter_named:
+            assert isinstance(cls._filter_named, dict), (
                 '`Meta.filter_named` must be a dict')
-            for name, filter_by in filter_named.items():
-                self._configure_filter_by(name, filter_by)
 
-    def _configure_filter_by(self, name, filter_by):
+        cls._filter_dispatch = cls._build_filter_dispatch()
+        cls._filter_configs = {None: (None, None)}
+        if cls._filter_by:
+            cls._configure_filter_by(None, cls._filter_by)
+
+        for name, filter_by in (cls._filter_named or {}).items():
+            cls._configure_filter_by(name, filter_by)
+
+        cls._prepared_filters = {
+            name: cls._prepare_filter(name, fields, filter_together)
+            for name, (fields, filter_together) in cls._filter_configs.items()}
+
+    @classmethod
+    def _build_filter_dispatch(cls):
+        """Map the configured filter names to `{field: method name}` dicts.
+
+        The unnamed filter is stored under `None`. The dict of a named filter
+        already includes the unnamed `filter_by_...` methods as fallbacks.
+        """
+        attrs = [attr for attr in dir(cls) if attr.startswith('filter_')]
+
+        def find(prefix):
+            # Slicing creates new strings; intern the field names so lookups
+            # with the (interned) validated_data keys can match by identity.
+            return {sys.intern(attr[len(prefix):]): attr for attr in attrs
+                    if attr.startswith(prefix)}
+
+        unnamed = find('filter_by_')
+        dispatch = {None: unnamed}
+        for name in cls._filter_named or ():
+            dispatch[name] = {**unnamed, **find(f'filter_{name}_by_')}
+        return dispatch
+
+    @classmethod
+    def _configure_filter_by(cls, name, filter_by):
         if isinstance(filter_by, dict):
             fields = filter_by.get('fields', tuple())
             filter_together = filter_by.get('filter_together')
@@ -52,10 +146,36 @@ class FilterMixin(object):
             raise NotImplementedError('`filter_by` must a type of either '
                                       '`tuple`, `list`, or `dict`')
 
-        f = partial(self.filter, name=name, fields=fields,
-                    filter_together=filter_together)
-        filter_func_name = 'filter_{}'.format(name) if name else 'filter'
-        setattr(self, filter_func_name, f)
+        if name:
+            # An empty dict keeps `filter` from falling back to the
+            # `filter_together` of the unnamed configuration.
+            filter_together = filter_together or {}
+            setattr(cls, f'filter_{name}', _named_filter(name))
+        cls._filter_configs[name] = (fields, filter_together)
+
+    @classmethod
+    def _prepare_filter(cls, name, fields, filter_together):
+        """Resolve everything `filter` needs that does not depend on data.
+
+        Returns a `(fields, funcs, prefixes, together_fields, together)`
+        tuple, where `funcs` maps fields to the names of their filter methods
+        and `together` holds a `(func_name, fields, getter)` step for each
+        entry of `filter_together`.
+        """
+        if fields is not None:
+            # Drop duplicates but keep the order the filters are applied in.
+            fields = tuple(dict.fromkeys(fields))
+        filter_together = filter_together or {}
+        prefixes = (f'filter_{name}_by_', 'filter_by_') if name else (
+            'filter_by_',)
+        # Filter names that are not configured are looked up with getattr.
+        funcs = cls._filter_dispatch.get(name, {})
+        together_fields = frozenset(chain.from_iterable(
+            filter_together.values()))
+        together = tuple(
+            (prefixes[0] + k, tuple(f), _values_getter(f))
+            for k, f in filter_together.items())
+        return fields, funcs, prefixes, together_fields, together
 
     def filter(self, qs, name=None, fields=None, filter_together=None,
                raise_exception=True):
@@ -63,50 +183,109 @@ class FilterMixin(object):
             #raise NotImplementedError(
                 #'Cannot call `filter` directly if `Meta.filter_fields` is '
                 #'a dict')
-        filter_together = filter_together or {}
-
-        if not self.is_valid(raise_exception=raise_exception):
+        if not self._is_valid_for_filter(raise_exception):
             return qs
 
-        g = self.validated_data.items()
-        if fields is not None:
-            g = ((k, v) for k, v in self.validated_data.items() if k in fields)
+        for func, args, kwargs in self._iter_filter_steps(
+                name, fields, filter_together):
+            qs = func(qs, *args, **kwargs)
+        return qs
 
-        name_list = ['filter_by_']
-        if name:
-            name_list.insert(0, 'filter_{}_by_'.format(name))
-
-        for k, v in g:
-            for name in name_list:
-                func = getattr(self, name + k, None)
-                if func:
-                    qs = func(qs, v)
-                    break
-            else:
-                if not k in chain.from_iterable(filter_together.values()):
-                    funcs = ', '.join([(n + k) for n in name_list])
-                    raise AttributeError(
-                        'Implement one of the following: ' + funcs)
-
-        for k, fields in filter_together.items():
-            func_name = name_list[0] + k
-            try:
-                func = getattr(self, func_name)
-            except AttributeError:
-                raise AttributeError(f'Implement {func_name}')
-            kwargs = {field: self.validated_data[field] for field in fields}
-            qs = func(qs, **kwargs)
+    def filter_many(self, querysets, name=None, fields=None,
+                    filter_together=None, raise_exception=True):
+        """Filter each of `querysets` like `filter` would, returning a list.
 
-        return qs
+        The data is validated and the filter methods are resolved only once
+        for all of the querysets. The `filter_by_...` methods are applied
+        directly, so an overridden `filter` method is not called.
+        """
+        if not self._is_valid_for_filter(raise_exception):
+            return list(querysets)
+
+        steps = list(self._iter_filter_steps(name, fields, filter_together))
+        result = []
+        for qs in querysets:
+            for func, args, kwargs in steps:
+                qs = func(qs, *args, **kwargs)
+            result.append(qs)
+        return result
+
+    def _is_valid_for_filter(self, raise_exception):
+        # `is_valid` caches its result; only call it again if it has not run
+        # yet or failed (so that the errors get re-raised).
+        if hasattr(self, '_validated_data') and not self._errors:
+            return True
+        return self.is_valid(raise_exception=raise_exception)
+
+    def _iter_filter_steps(self, name, fields, filter_together):
+        """Yield a `(func, args, kwargs)` tuple for each method to apply."""
+        fields, funcs, prefixes, together_fields, together = (
+            self._get_filter_config(name, fields, filter_together))
+        validated_data = self.validated_data
+        # Single field filters depend on the keys of the data when no fields
+        # are configured, so they cannot share a precomputed plan with the
+        # `filter_together` steps.
+        for k in self._get_filter_keys(fields, validated_data):
+            func = self._get_single_filter(funcs, prefixes, together_fields, k)
+            if func is not None:
+                yield func, (validated_data[k],), _NO_KWARGS
+
+        for func_name, fields, getter in together:
+            func = self._get_together_filter(func_name)
+            yield func, (), dict(zip(fields, getter(validated_data)))
+
+    def _get_filter_config(self, name, fields, filter_together):
+        # Arguments that are not given default to `Meta.filter_by`.
+        default_fields, default_filter_together = self._filter_configs[None]
+        if fields is None:
+            fields = default_fields
+        if filter_together is None:
+            filter_together = default_filter_together
+
+        # Reuse the prepared configuration if the arguments are the ones
+        # configured for `name`.
+        configured = self._filter_configs.get(name)
+        if (configured is not None and configured[0] is fields and
+                configured[1] is filter_together):
+            return self._prepared_filters[name]
+        return self._prepare_filter(name, fields, filter_together)
+
+    @staticmethod
+    def _get_filter_keys(fields, validated_data):
+        if fields is None:
+            return validated_data
+        return [k for k in fields if k in validated_data]
+
+    def _get_single_filter(self, funcs, prefixes, together_fields, field):
+        """Return the bound filter method for `field`.
+
+        Returns None if there is no method but `field` is filtered together
+        with other fields.
+        """
+        func_name = funcs.get(field)
+        if func_name is not None:
+            if not func_name.startswith(prefixes[0]):
+                # Resolved to the unnamed fallback when the class was
+                # created; the named method may have been added since.
+                func = getattr(self, prefixes[0] + field, None)
+                if func is not None:
+                    return func
+            func = getattr(self, func_name, None)
+            if func is not None:
+                return func
+        # Not seen when the class was created, e.g. added to the instance.
+        for prefix in prefixes:
+            func = getattr(self, prefix + field, None)
+            if func is not None:
+                return func
+        if field not in together_fields:
+            raise AttributeError(
+                'Implement one of the following: ' +
+                ', '.join(n + field for n in prefixes))
+        return None
 
-    @cached_property
-    def _filter_by(self):
-        meta = getattr(self, 'Meta', None)
-        if meta:
-            return getattr(meta, 'filter_by', None)
-
-    @cached_property
-    def _filter_named(self):
-        meta = getattr(self, 'Meta', None)
-        if meta:
-            return getattr(meta, 'filter_named', None)
+    def _get_together_filter(self, func_name):
+        func = getattr(self, func_name, None)
+        if func is None:
+            raise AttributeError(f'Implement {func_name}')
+        return func
@@ -72,8 +72,11 @@ class TestSimpleBackend(APITestCase):
         assert response.data == [{'id': self.u1.id, 'username': 'mary'}]
 
         # Finally just make sure the exception would be raised:
-        Serializer.Meta.filter_by = None
-        view = make_list_view(Serializer)
+        class UnrestrictedSerializer(Serializer):
+            class Meta:
+                filter_by = None
+
+        view = make_list_view(UnrestrictedSerializer)
         with self.assertRaises(Expected):
             view(self.factory.get(f'/?username=ann&id={self.u1.id}'))
 
@@ -96,8 +99,11 @@ class TestSimpleBackend(APITestCase):
         response = view(self.factory.get(f'/?username=ann&id={self.u1.id}'))
         assert response.data == [{'id': self.u1.id, 'username': 'mary'}]
 
-        del Serializer.Meta.filter_by
-        view = make_list_view(Serializer)
+        class NamedOnlySerializer(Serializer):
+            class Meta:
+                filter_named = {'users': ('username',)}
+
+        view = make_list_view(NamedOnlySerializer)
         response = view(self.factory.get(f'/?username=ann&id={self.u1.id}'))
         assert response.data == []
 
@@ -204,3 +210,86 @@ class TestSimpleBackend(APITestCase):
         view = make_list_view(Serializer)
         response = view(self.factory.get('/?username=ann'))
         assert response.data == [{'id': self.u2.id, 'username': 'mary-ann'}]
+
+    def test_generated_filter_class_is_reused(self):
+        class Serializer(serializers.Serializer):
+            username = serializers.CharField(required=False)
+
+            def filter_by_username(self, qs, username):
+                return qs.filter(username__icontains=username)
+
+        view = make_list_view(Serializer)
+        view(self.factory.get('/?username=ann'))
+        generated = Serializer._serfilter_subclass
+        assert issubclass(generated, FilterMixin)
+
+        response = view(self.factory.get('/?username=ann'))
+        assert response.data == [{'id': self.u2.id, 'username': 'mary-ann'}]
+        assert Serializer._serfilter_subclass is generated
+
+    def test_view_instance_serializer_class_is_not_cached(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            username = serializers.CharField(required=False)
+
+            def filter_by_username(self, qs, username):
+                return qs.filter(username__icontains=username)
+
+        class View(ListAPIView):
+            queryset = User.objects.order_by('id')
+            filter_backends = [SerializerBackend]
+            serializer_filter_class = None
+            serializer_class = UserSerializer
+
+        view = View.as_view(serializer_filter_class=Serializer)
+        response = view(self.factory.get('/?username=ann'))
+        assert response.data == [{'id': self.u2.id, 'username': 'mary-ann'}]
+
+    def test_serializer_filter_class_property(self):
+        class MarySerializer(FilterMixin, serializers.Serializer):
+            def filter(self, qs):
+                return qs.filter(username='mary')
+
+        class AnnSerializer(FilterMixin, serializers.Serializer):
+            def filter(self, qs):
+                return qs.filter(username='mary-ann')
+
+        class View(ListAPIView):
+            queryset = User.objects.order_by('id')
+            filter_backends = [SerializerBackend]
+            serializer_class = UserSerializer
+
+            @property
+            def serializer_filter_class(self):
+                if self.request.query_params.get('ann'):
+                    return AnnSerializer
+                return MarySerializer
+
+        view = View.as_view()
+        response = view(self.factory.get('/'))
+        assert response.data == [{'id': self.u1.id, 'username': 'mary'}]
+        response = view(self.factory.get('/?ann=1'))
+        assert response.data == [{'id': self.u2.id, 'username': 'mary-ann'}]
+
+    def test_skip_empty(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            username = serializers.CharField(default='mary-ann')
+
+            class Meta:
+                skip_empty = True
+
+            def filter_by_username(self, qs, username):
+                return qs.filter(username=username)
+
+        view = make_list_view(Serializer)
+        response = view(self.factory.get('/'))
+        assert len(response.data) == 2
+        response = view(self.factory.get('/?username=mary'))
+        assert response.data == [{'id': self.u1.id, 'username': 'mary'}]
+
+        class NotSkippingSerializer(Serializer):
+            class Meta:
+                skip_empty = False
+
+        view = make_list_view(NotSkippingSerializer)
+        response = view(self.factory.get('/'))
+        assert response.data == [{'id': self.u2.id, 'username': 'mary-ann'}]
@@ -47,6 +47,153 @@ class TestMethodLookup(TestCase):
         ])
         assert list(li) == [{'name': 'berrybears', 'avg_age': 12.2, 'p_count': 5}]
 
+    def test_named_filter_calls_overridden_filter(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            q = serializers.CharField(required=False)
+
+            class Meta:
+                filter_named = {'xs': ('q',)}
+
+            def filter(self, qs, **kwargs):
+                calls.append(kwargs['name'])
+                return super().filter(qs, **kwargs)
+
+            def filter_by_q(self, li, q):
+                return [o for o in li if q in o]
+
+        calls = []
+        serializer = Serializer(data={'q': 'a'})
+        assert serializer.filter_xs(['a', 'b']) == ['a']
+        assert calls == ['xs']
+
+    def test_static_and_class_methods(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            a = serializers.IntegerField(required=False)
+            b = serializers.IntegerField(required=False)
+
+            @staticmethod
+            def filter_by_a(li, a):
+                return [o for o in li if o >= a]
+
+            @classmethod
+            def filter_by_b(cls, li, b):
+                return [o for o in li if o <= b]
+
+        serializer = Serializer(data={'a': 2, 'b': 3})
+        assert serializer.filter([1, 2, 3, 4]) == [2, 3]
+
+    def test_methods_added_after_class_creation(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            a = serializers.IntegerField(required=False)
+            b = serializers.IntegerField(required=False)
+
+        Serializer.filter_by_a = lambda self, li, a: [o for o in li if o >= a]
+        serializer = Serializer(data={'a': 2, 'b': 3})
+        serializer.filter_by_b = lambda li, b: [o for o in li if o <= b]
+        assert serializer.filter([1, 2, 3, 4]) == [2, 3]
+
+        # A named method added later takes precedence over the unnamed one
+        # the class had.
+        class NamedSerializer(FilterMixin, serializers.Serializer):
+            q = serializers.CharField(required=False)
+
+            class Meta:
+                filter_named = {'xs': ('q',)}
+
+            def filter_by_q(self, li, q):
+                return 'unnamed'
+
+        serializer = NamedSerializer(data={'q': 'a'})
+        assert serializer.filter_xs([]) == 'unnamed'
+        serializer.filter_xs_by_q = lambda li, q: 'named'
+        assert serializer.filter_xs([]) == 'named'
+
+    def test_filter_name_containing_by(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            a = serializers.IntegerField(required=False)
+
+            class Meta:
+                filter_named = {'group_by': ('a',)}
+
+            def filter_by_a(self, li, a):
+                return []
+
+            def filter_group_by_by_a(self, li, a):
+                return [o for o in li if o >= a]
+
+        serializer = Serializer(data={'a': 2})
+        assert serializer.filter_group_by([1, 2, 3]) == [2, 3]
+
+    def test_unconfigured_filter_name(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            a = serializers.IntegerField(required=False)
+
+            def filter_by_a(self, li, a):
+                return []
+
+            def filter_other_by_a(self, li, a):
+                return [o for o in li if o >= a]
+
+        serializer = Serializer(data={'a': 2})
+        assert serializer.filter([1, 2, 3], name='other') == [2, 3]
+
+    def test_arguments_override_configuration_separately(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            a = serializers.CharField(required=False)
+            b = serializers.CharField(required=False)
+            c = serializers.CharField(required=False)
+            d = serializers.CharField(required=False)
+
+            class Meta:
+                filter_by = {
+                    'fields': ('a', 'b', 'c', 'd'),
+                    'filter_together': {'cd': ('c', 'd')},
+                }
+                filter_named = {'xs': {
+                    'fields': ('a', 'b', 'c', 'd'),
+                    'filter_together': {'cd': ('c', 'd')},
+                }}
+
+            def filter_by_a(self, li, a):
+                return li + ['a']
+
+            def filter_by_b(self, li, b):
+                return li + ['b']
+
+            def filter_by_cd(self, li, c, d):
+                return li + ['cd']
+
+            def filter_xs_by_cd(self, li, c, d):
+                return li + ['xs_cd']
+
+        serializer = Serializer(data={'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        assert serializer.filter([]) == ['a', 'b', 'cd']
+        assert serializer.filter([], fields=('a', 'c', 'd')) == ['a', 'cd']
+        assert (serializer.filter_xs([], fields=('a', 'c', 'd')) ==
+                ['a', 'xs_cd'])
+        assert serializer.filter([], fields=('a', 'b')) == ['a', 'b', 'cd']
+
+    def test_named_configuration_only_applies_to_named_method(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            a = serializers.CharField(required=False)
+            b = serializers.CharField(required=False)
+
+            class Meta:
+                filter_by = ('a',)
+                filter_named = {'xs': ('b',)}
+
+            def filter_by_a(self, li, a):
+                return li + ['a']
+
+            def filter_by_b(self, li, b):
+                return li + ['b']
+
+        serializer = Serializer(data={'a': 1, 'b': 2})
+        assert serializer.filter_xs([]) == ['b']
+        # Calling `filter` with a name only changes the method prefixes, the
+        # fields still come from `Meta.filter_by`.
+        assert serializer.filter([], name='xs') == ['a']
+
     def test_method_missing(self):
         class Serializer(FilterMixin, serializers.Serializer):
             q = serializers.CharField(required=False)
@@ -141,3 +288,45 @@ class TestFilterTogether(TestCase):
             'city': 'paris', 'distance': 1000, 'postal_code': 84843})
         result = serializer.filter_cities(['marseille', 'sidney'])
         assert result == ['marseille']
+
+
+class TestFilterMany(TestCase):
+    def test_filter_many(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            min_age = serializers.IntegerField(required=False)
+
+            class Meta:
+                filter_named = {'persons': ('min_age',)}
+
+            def filter_persons_by_min_age(self, persons, age):
+                return [p for p in persons if p['age'] >= age]
+
+        serializer = Serializer(data={'min_age': 18})
+        result = serializer.filter_many([
+            [{'age': 17}, {'age': 18}],
+            [],
+            [{'age': 40}],
+        ], name='persons')
+        assert result == [[{'age': 18}], [], [{'age': 40}]]
+
+    def test_filter_many_validation_error_silently(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            q = serializers.CharField()
+
+        serializer = Serializer(data={'Q': 1})
+        result = serializer.filter_many(iter([[1], [2]]),
+                                        raise_exception=False)
+        assert result == [[1], [2]]
+
+    def test_filter_many_does_not_call_filter(self):
+        class Serializer(FilterMixin, serializers.Serializer):
+            q = serializers.CharField(required=False)
+
+            def filter(self, qs, **kwargs):
+                raise AssertionError('filter_many should not call filter')
+
+            def filter_by_q(self, li, q):
+                return [o for o in li if q in o]
+
+        serializer = Serializer(data={'q': 'a'})
+        assert serializer.filter_many([['a', 'b'], ['ba']]) == [['a'], ['ba']]